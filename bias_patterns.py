@@ -4,6 +4,10 @@ All patterns based on peer-reviewed research and legal precedent.
 NO AI/ML models - pure rule-based detection to avoid inherited bias.
 """
 
+import re
+
+import re2
+
 BIAS_PATTERNS = [
     # ============================================
     # CATEGORY 1: HISTORICAL BIAS
@@ -175,4 +179,208 @@ def get_pattern_by_id(pattern_id):
     for pattern in BIAS_PATTERNS:
         if pattern["id"] == pattern_id:
             return pattern
-    return None
\ No newline at end of file
+    return None
+
+
+# Severity names interned to small ints at load time, so scoring can index
+# a weights tuple instead of hashing strings
+SEVERITY_CODES = {"low": 0, "medium": 1, "high": 2}
+
+
+def _add_severity_codes():
+    """Store each pattern's severity code alongside its severity name."""
+    for pattern_def in BIAS_PATTERNS:
+        pattern_def["severity_code"] = SEVERITY_CODES[pattern_def["severity"]]
+
+
+_add_severity_codes()
+
+
+# A pattern made only of plain-literal alternatives, e.g. \b(ninja|guru)\b
+_LITERAL_ALTERNATION = re.compile(r"\\b\(([^\\.^$*+?{}\[\]()]+)\)\\b")
+
+
+def literal_alts_to_trie_regex(alternatives):
+    r"""
+    Build a regex matching any of the literal alternatives, with shared
+    prefixes factored into a character trie. Characters are escaped, so
+    alternatives are matched literally:
+    ["rockstar", "rock star", "ninja"] -> "(?:ninja|rock(?:\ star|star))".
+    Where one alternative is a prefix of another the longer one is preferred.
+    """
+    trie = {}
+    for alternative in alternatives:
+        node = trie
+        for char in alternative:
+            node = node.setdefault(char, {})
+        node[""] = None  # end of an alternative
+    return _trie_node_regex(trie)
+
+
+def _trie_node_regex(node):
+    """Emit the regex for one trie node; alternations come out grouped."""
+    branches = [
+        re.escape(char) + _trie_node_regex(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if not branches:
+        return ""
+    if len(branches) == 1:
+        body = branches[0]
+        grouped = "(?:" + body + ")"
+    else:
+        body = grouped = "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        # An alternative ends here; longer ones continue optionally
+        return grouped + "?"
+    return body
+
+
+def _factor_pattern(pattern):
+    """Rewrite a literal-alternation pattern as a trie regex; others unchanged."""
+    literal = _LITERAL_ALTERNATION.fullmatch(pattern)
+    if not literal:
+        return pattern
+    return r"\b" + literal_alts_to_trie_regex(literal.group(1).split("|")) + r"\b"
+
+
+# Structure-of-arrays views of BIAS_PATTERNS. The matching hot path only
+# needs the short fields, indexed by pattern position; the long explanation
+# text is looked up by id once a pattern has actually matched. Patterns here
+# are the compiled form: literal alternations are trie-factored at import,
+# so BIAS_PATTERNS itself stays readable.
+HOT_FIELDS = {
+    "ids": [p["id"] for p in BIAS_PATTERNS],
+    "patterns": [_factor_pattern(p["pattern"]) for p in BIAS_PATTERNS],
+    "categories": [p["category"] for p in BIAS_PATTERNS],
+    "severities": [p["severity"] for p in BIAS_PATTERNS],
+    "severity_codes": [p["severity_code"] for p in BIAS_PATTERNS],
+}
+
+COLD_FIELDS = {
+    p["id"]: {
+        "why": p["why"],
+        "excludes": p["excludes"],
+        "impact": p["impact"],
+        "research": p["research"],
+        "alternative": p["alternative"]
+    }
+    for p in BIAS_PATTERNS
+}
+
+
+def get_hot_fields():
+    """Return parallel lists of pattern ids, regexes, categories and severities (names and codes)."""
+    return HOT_FIELDS
+
+
+def get_cold_fields():
+    """Return explanation fields (why, excludes, ...) keyed by pattern id."""
+    return COLD_FIELDS
+
+
+# Escape sequences (kept as written) or runs of uppercase literal text
+_ESCAPE_OR_UPPER = re.compile(r"\\[pP]\{[^}]*\}|\\.|[A-Z]+")
+
+
+def _lower_literals(pattern):
+    r"""
+    Lowercase the literal text of a regex, leaving escapes untouched so
+    classes like \S, \W or \D keep their meaning.
+    """
+    return _ESCAPE_OR_UPPER.sub(
+        lambda m: m.group(0) if m.group(0).startswith("\\") else m.group(0).lower(),
+        pattern
+    )
+
+
+# Python's str regexes treat \s as a Unicode class; RE2's is ASCII only.
+# This equivalent keeps pasted text (non-breaking or thin spaces) matching
+# the way the patterns were written, as (outside, inside) a character class.
+# \d deliberately stays ASCII [0-9]: a non-ASCII digit at a pattern edge
+# would defeat RE2's ASCII \b, so only ASCII digits are recognised.
+_UNICODE_CLASSES = {
+    r"\s": (r"[\s\x0b\x1c-\x1f\x85\p{Z}]", r"\s\x0b\x1c-\x1f\x85\p{Z}"),
+}
+
+# Escape sequences, or brackets opening/closing a character class
+_ESCAPE_OR_BRACKET = re.compile(r"\\[pP]\{[^}]*\}|\\.|\[|\]")
+
+
+def _unicode_classes(pattern, classes=_UNICODE_CLASSES):
+    r"""Rewrite class escapes (by default \s, for RE2) in or outside character classes."""
+    in_class = False
+    
+    def replace(m):
+        nonlocal in_class
+        token = m.group(0)
+        if token == "[":
+            in_class = True
+        elif token == "]":
+            in_class = False
+        elif token in classes:
+            return classes[token][in_class]
+        return token
+    
+    return _ESCAPE_OR_BRACKET.sub(replace, pattern)
+
+
+# RE2's \b is ASCII-only too. The analyzer re-checks hits next to a
+# non-ASCII word character with Python re (see BiasAnalyzer._scan), which
+# relies on every pattern being anchored with \b at both ends, next to ASCII
+# characters.
+def _check_word_boundaries():
+    r"""Raise ValueError for any pattern not anchored with \b at both ends."""
+    for pattern_def in BIAS_PATTERNS:
+        if not (pattern_def["pattern"].startswith(r"\b") and pattern_def["pattern"].endswith(r"\b")):
+            raise ValueError(f"Pattern {pattern_def['id']} must start and end with \\b")
+
+
+_check_word_boundaries()
+
+
+def _compile_patterns():
+    """
+    Fuse every pattern into one RE2 alternation (one named group per
+    pattern id) so text is scanned once instead of once per pattern.
+    Pattern literals are lowercased and matched against lowercased text, so
+    no case folding happens inside the matcher.
+    Returns the compiled regex and a group number -> BIAS_PATTERNS index map.
+    """
+    combined = re2.compile(
+        "|".join(
+            f"(?P<{pattern_id}>{_unicode_classes(_lower_literals(pattern))})"
+            for pattern_id, pattern in zip(HOT_FIELDS["ids"], HOT_FIELDS["patterns"])
+        ).encode("utf-8")
+    )
+    pattern_indexes = {pattern_id: i for i, pattern_id in enumerate(HOT_FIELDS["ids"])}
+    group_patterns = {
+        group: pattern_indexes[name.decode("utf-8")]
+        for name, group in combined.groupindex.items()
+    }
+    return combined, group_patterns
+
+
+# Compiled at import so every worker forked from a preloaded parent
+# shares it instead of recompiling
+COMBINED_REGEX, GROUP_PATTERNS = _compile_patterns()
+
+
+def get_compiled():
+    """Return the combined pattern regex and its group -> pattern index map."""
+    return COMBINED_REGEX, GROUP_PATTERNS
+
+
+# Python re versions of each pattern, indexed like BIAS_PATTERNS, for the
+# rare hits RE2's ASCII \b gets wrong. \d is kept to ASCII digits as in RE2.
+_ASCII_DIGITS = {r"\d": ("[0-9]", "0-9")}
+FALLBACK_REGEXES = [
+    re.compile(_unicode_classes(p["pattern"], _ASCII_DIGITS), re.IGNORECASE)
+    for p in BIAS_PATTERNS
+]
+
+
+def get_fallback_regexes():
+    """Return the per-pattern Python re fallbacks, indexed like BIAS_PATTERNS."""
+    return FALLBACK_REGEXES
\ No newline at end of file
@@ -3,9 +3,62 @@ FairWords Bias Analyzer
 Rule-based detection engine - NO AI/ML to avoid inherited bias
 """
 
-import re
-from typing import List, Dict
-from bias_patterns import get_all_patterns, get_patterns_by_category
+import hashlib
+import sys
+from collections import Counter, OrderedDict
+from threading import Lock
+from typing import List, Dict, Iterator, Tuple
+from bias_patterns import (
+    get_all_patterns, get_patterns_by_category, get_compiled,
+    get_hot_fields, get_cold_fields, get_fallback_regexes
+)
+
+# Number of recent analysis results kept in memory, keyed by text digest
+RESULT_CACHE_SIZE = 256
+
+# Results estimated larger than this (bytes) aren't cached, so the cache
+# stays within RESULT_CACHE_SIZE * 64 KB even for hit-heavy texts
+RESULT_CACHE_MAX_ENTRY_BYTES = 64 * 1024
+
+# Points deducted from the score per occurrence, indexed by severity code
+# (see bias_patterns.SEVERITY_CODES): low -3, medium -8, high -15
+SEVERITY_WEIGHTS = (3, 8, 15)
+
+NO_FINDINGS_SUMMARY = "No bias patterns detected. This job description uses inclusive language."
+
+
+def _result_size(results: Dict) -> int:
+    """Rough memory footprint in bytes of the per-occurrence data in results."""
+    size = 0
+    for finding in results["findings"]:
+        # A small int object plus its list slot per position
+        size += 36 * len(finding["positions"])
+        size += sum(sys.getsizeof(phrase) for phrase in finding["matches"])
+    return size
+
+
+def _is_word_char(char: str) -> bool:
+    r"""Word character as Python's Unicode-aware \w defines it."""
+    return char.isalnum() or char == "_"
+
+
+def _word_char_before(data: bytes, offset: int) -> bool:
+    """True if a non-ASCII word character ends at offset in UTF-8 data."""
+    if offset == 0 or data[offset - 1] < 0x80:
+        return False
+    begin = offset - 1
+    while begin > 0 and data[begin] & 0xC0 == 0x80:
+        begin -= 1
+    return _is_word_char(data[begin:offset].decode("utf-8", "surrogatepass"))
+
+
+def _word_char_after(data: bytes, offset: int) -> bool:
+    """True if a non-ASCII word character starts at offset in UTF-8 data."""
+    if offset >= len(data) or data[offset] < 0x80:
+        return False
+    lead = data[offset]
+    length = 2 if lead < 0xE0 else 3 if lead < 0xF0 else 4
+    return _is_word_char(data[offset:offset + length].decode("utf-8", "surrogatepass"))
 
 
 class BiasAnalyzer:
@@ -18,11 +71,24 @@ class BiasAnalyzer:
     def __init__(self):
         self.patterns = get_all_patterns()
         self.patterns_by_category = get_patterns_by_category()
+        self.hot = get_hot_fields()
+        self.cold = get_cold_fields()
+        
+        # Combined regex and group map are compiled once at import time,
+        # see bias_patterns.get_compiled()
+        self.combined_regex, self.group_patterns = get_compiled()
+        self.fallback_regexes = get_fallback_regexes()
+        
+        # LRU cache of recent results - analysis depends only on the text.
+        # Long texts are analyzed in worker threads, so access is guarded by a lock.
+        self._results = OrderedDict()
+        self._results_lock = Lock()
     
     def analyze(self, text: str) -> Dict:
         """
         Analyze text for bias patterns.
         Returns complete analysis with findings, score, and explanations.
+        Results are cached, so callers must not mutate the returned dict.
         """
         if not text or not text.strip():
             return {
@@ -32,63 +98,188 @@ class BiasAnalyzer:
                 "categories_affected": []
             }
         
+        key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        
+        with self._results_lock:
+            results = self._results.get(key)
+            if results is not None:
+                self._results.move_to_end(key)
+                return results
+        
+        results = self._analyze(text)
+        if _result_size(results) > RESULT_CACHE_MAX_ENTRY_BYTES:
+            return results
+        
+        with self._results_lock:
+            self._results[key] = results
+            if len(self._results) > RESULT_CACHE_SIZE:
+                self._results.popitem(last=False)
+        
+        return results
+    
+    def _analyze(self, text: str) -> Dict:
+        """Run the full, uncached analysis of non-empty text."""
         # Detect all bias patterns
-        findings = self._detect_patterns(text)
+        findings, matched, severity_counts, category_counts = self._detect_patterns(text)
         
-        # Calculate fairness score
-        score = self._calculate_score(findings)
+        # Fast path for clean text: nothing to score or summarize
+        if not findings:
+            return {
+                "score": 100,
+                "findings": findings,
+                "patterns": {},
+                "total_issues": 0,
+                "categories_affected": [],
+                "summary": NO_FINDINGS_SUMMARY,
+                "text_length": len(text),
+                "word_count": len(text.split())
+            }
         
-        # Get affected categories
-        categories_affected = list(set([f["category"] for f in findings]))
+        # Calculate fairness score
+        score = self._calculate_score(findings, matched)
         
         # Generate summary
-        summary = self._generate_summary(findings, score)
+        summary = self._generate_summary(len(findings), score, severity_counts, category_counts)
+        
+        # Static explanation fields are sent once per matched pattern, keyed
+        # by id, rather than copied into every finding
+        patterns = {f["id"]: self.cold[f["id"]] for f in findings}
         
         return {
             "score": score,
             "findings": findings,
+            "patterns": patterns,
             "total_issues": len(findings),
-            "categories_affected": categories_affected,
+            "categories_affected": list(category_counts),
             "summary": summary,
             "text_length": len(text),
             "word_count": len(text.split())
         }
     
-    def _detect_patterns(self, text: str) -> List[Dict]:
+    def _scan(self, data: bytes, text: str) -> Iterator[Tuple[int, int, int]]:
+        r"""
+        Scan UTF-8 encoded text once with the combined regex; text is the
+        original string, used to re-check hits RE2's \b can't decide.
+        Yields (pattern index, start, end) byte offsets for every hit,
+        in order of start offset.
+        """
+        last_end = [0] * len(self.patterns)
+        
+        match = self.combined_regex.search(data)
+        while match:
+            # RE2 match accessors take group numbers, not names
+            group = match.lastindex
+            index = self.group_patterns[group]
+            start = match.start(group)
+            
+            # Skip hits overlapping an earlier hit of the same pattern, as a
+            # per-pattern finditer would. Limitation: the alternation is
+            # leftmost-first, so if two patterns match at the same offset only
+            # the earlier-listed one is reported there. No current patterns
+            # share a start offset (see tests/test_analyzer.py).
+            if start >= last_end[index]:
+                end = match.end(group)
+                
+                # RE2's \b is ASCII-only, so it sees a boundary next to any
+                # non-ASCII character. Every pattern is \b-anchored at both
+                # ends; for hits touching a non-ASCII word character
+                # ("éninja", "2 years expérience") re-match that one pattern
+                # with Python re, which keeps Unicode \b semantics and may
+                # still find a shorter match at the same offset.
+                if _word_char_before(data, start) or _word_char_after(data, end):
+                    end = self._fallback_end(index, data, text, start)
+                if end is not None:
+                    last_end[index] = end
+                    yield index, start, end
+            
+            # Resume one byte after the hit rather than at its end, so a long
+            # match (e.g. intern ... years experience) can't hide other
+            # patterns inside its span
+            match = self.combined_regex.search(data, start + 1)
+    
+    def _fallback_end(self, index: int, data: bytes, text: str, start: int):
+        """
+        Match pattern index with Python re at byte offset start of data.
+        Returns the byte end offset of the match, or None.
+        """
+        char_start = len(str(memoryview(data)[:start], "utf-8", "surrogatepass"))
+        match = self.fallback_regexes[index].match(text, char_start)
+        if not match:
+            return None
+        return start + len(text[char_start:match.end()].encode("utf-8", "surrogatepass"))
+    
+    def _detect_patterns(self, text: str) -> Tuple[List[Dict], List[int], Counter, Counter]:
         """
-        Detect all bias patterns in text using regex matching.
-        Returns list of findings with full context.
+        Detect all bias patterns in text using a single combined regex scan.
+        Returns list of findings (explanations are looked up separately by id),
+        the matching pattern index for each finding, and the number of
+        findings per severity and per category.
         """
+        # Scan UTF-8 bytes: RE2 re-encodes str input on every call.
+        # bytes.lower() only folds ASCII letters, so offsets into the
+        # lowercased copy are valid in the original. surrogatepass keeps lone
+        # surrogates (valid in JSON strings) from failing the request.
+        data = text.encode("utf-8", "surrogatepass")
+        ascii_only = len(data) == len(text)
+        # Zero-copy slices for decoding gaps between hits
+        view = memoryview(data)
+        
+        # Per pattern: unique matched phrases (first-seen order) and positions,
+        # aggregated as hits stream in
+        buckets = {}
+        byte_pos = char_pos = 0
+        
+        for index, start, end in self._scan(data.lower(), text):
+            if ascii_only:
+                position = start
+            else:
+                # Hits arrive in order, so map byte offsets to character
+                # offsets incrementally
+                char_pos += len(str(view[byte_pos:start], "utf-8", "surrogatepass"))
+                byte_pos = start
+                position = char_pos
+            
+            bucket = buckets.get(index)
+            if bucket is None:
+                bucket = buckets[index] = ({}, [])
+            phrases, positions = bucket
+            phrases[data[start:end]] = None
+            positions.append(position)
+        
+        # The scan's first search doubles as the pre-scan: clean text costs
+        # one linear pass and allocates nothing per pattern
+        if not buckets:
+            return [], [], Counter(), Counter()
+        
+        ids = self.hot["ids"]
+        categories = self.hot["categories"]
+        severities = self.hot["severities"]
         findings = []
+        matched = sorted(buckets)
         
-        for pattern_def in self.patterns:
-            # Compile regex pattern
-            regex = re.compile(pattern_def["pattern"], re.IGNORECASE)
+        # Summary inputs, counted in the same pass
+        severity_counts = Counter()
+        category_counts = Counter()
+        
+        # Report in pattern order, touching only the patterns that matched
+        for index in matched:
+            phrases, positions = buckets[index]
             
-            # Find all matches
-            matches = list(regex.finditer(text))
+            findings.append({
+                "id": ids[index],
+                "category": categories[index],
+                "severity": severities[index],
+                "matches": [phrase.decode("utf-8", "surrogatepass") for phrase in phrases],
+                "count": len(positions),
+                "positions": positions
+            })
             
-            if matches:
-                # Get unique matched phrases
-                unique_matches = list(set([m.group(0) for m in matches]))
-                
-                findings.append({
-                    "id": pattern_def["id"],
-                    "category": pattern_def["category"],
-                    "severity": pattern_def["severity"],
-                    "matches": unique_matches,
-                    "count": len(matches),
-                    "positions": [m.start() for m in matches],
-                    "why": pattern_def["why"],
-                    "excludes": pattern_def["excludes"],
-                    "impact": pattern_def["impact"],
-                    "research": pattern_def["research"],
-                    "alternative": pattern_def["alternative"]
-                })
-        
-        return findings
+            severity_counts[severities[index]] += 1
+            category_counts[categories[index]] += 1
+        
+        return findings, matched, severity_counts, category_counts
     
-    def _calculate_score(self, findings: List[Dict]) -> int:
+    def _calculate_score(self, findings: List[Dict], matched: List[int]) -> int:
         """
         Calculate inclusivity score (0-100).
         Higher score = more inclusive.
@@ -97,33 +288,27 @@ class BiasAnalyzer:
         if not findings:
             return 100
         
-        # Start with perfect score
-        score = 100
-        
-        # Deduct points based on severity
-        severity_weights = {
-            "high": 15,    # High severity: -15 points per occurrence
-            "medium": 8,   # Medium severity: -8 points per occurrence
-            "low": 3       # Low severity: -3 points per occurrence
-        }
-        
-        for finding in findings:
-            severity = finding["severity"]
-            count = finding["count"]
-            deduction = severity_weights.get(severity, 5) * count
-            score -= deduction
+        # Start with perfect score, deduct points based on severity
+        severity_codes = self.hot["severity_codes"]
+        score = 100 - sum(
+            SEVERITY_WEIGHTS[severity_codes[index]] * finding["count"]
+            for index, finding in zip(matched, findings)
+        )
         
         # Cap between 0 and 100
         return max(0, min(100, score))
     
-    def _generate_summary(self, findings: List[Dict], score: int) -> str:
-        """Generate human-readable summary of analysis."""
-        if not findings:
-            return "No bias patterns detected. This job description uses inclusive language."
+    def _generate_summary(self, total: int, score: int,
+                          severity_counts: Counter, category_counts: Counter) -> str:
+        """
+        Generate human-readable summary of analysis from the number of
+        findings and their per-severity and per-category counts.
+        """
+        if not total:
+            return NO_FINDINGS_SUMMARY
         
-        total = len(findings)
-        categories = len(set([f["category"] for f in findings]))
-        high_severity = len([f for f in findings if f["severity"] == "high"])
+        categories = len(category_counts)
+        high_severity = severity_counts["high"]
         
         summary = f"Found {total} bias pattern{'s' if total > 1 else ''} across {categories} categor{'ies' if categories > 1 else 'y'}."
         
@@ -3,8 +3,12 @@ FairWords Backend API
 Bias detection service using rule-based pattern matching
 """
 
+import asyncio
+import json
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from fairwords_analyzer import BiasAnalyzer
 
@@ -26,11 +30,36 @@ app.add_middleware(
 # Initialize analyzer
 analyzer = BiasAnalyzer()
 
+# Texts longer than this are analyzed in a worker thread so a long scan
+# can't stall the event loop; shorter ones run inline
+INLINE_ANALYSIS_MAX_LENGTH = 10000
+
+# Longest text accepted by /analyze
+MAX_TEXT_LENGTH = 50000
+
 
 class AnalysisRequest(BaseModel):
+    # Plain str: constrained strings reject unpaired surrogates, which are
+    # valid in JSON, so length limits are checked in the handler
     text: str
 
 
+class ASCIIJSONResponse(JSONResponse):
+    """
+    JSON response with non-ASCII characters escaped. Matched phrases can
+    contain unpaired surrogates, which escape fine but can't be UTF-8 encoded.
+    """
+    
+    def render(self, content) -> bytes:
+        return json.dumps(
+            content,
+            ensure_ascii=True,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+        ).encode("ascii")
+
+
 @app.get("/")
 def read_root():
     return {
@@ -49,20 +78,25 @@ def health_check():
 
 
 @app.post("/analyze")
-def analyze_text(request: AnalysisRequest):
+async def analyze_text(request: AnalysisRequest):
     try:
         if not request.text or len(request.text.strip()) == 0:
             raise HTTPException(status_code=400, detail="Text cannot be empty")
         
-        if len(request.text) > 50000:
+        if len(request.text) > MAX_TEXT_LENGTH:
             raise HTTPException(status_code=400, detail="Text too long")
         
-        results = analyzer.analyze(request.text)
+        if len(request.text) > INLINE_ANALYSIS_MAX_LENGTH:
+            results = await asyncio.to_thread(analyzer.analyze, request.text)
+        else:
+            results = analyzer.analyze(request.text)
         
         if "error" in results:
             raise HTTPException(status_code=400, detail=results["error"])
         
-        return {"success": True, "data": results}
+        # Results are plain JSON types already; returning the response
+        # directly skips FastAPI's recursive jsonable_encoder pass
+        return ASCIIJSONResponse({"success": True, "data": results})
     
     except HTTPException:
         raise
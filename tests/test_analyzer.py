@@ -0,0 +1,206 @@
+"""
+Tests for BiasAnalyzer: the combined-regex scan, response shape, scoring and
+the result cache.
+Detection is checked against per-pattern matching with Python's re module,
+which is how the analyzer originally evaluated BIAS_PATTERNS.
+"""
+
+import random
+import re
+
+import pytest
+
+from bias_patterns import BIAS_PATTERNS
+import fairwords_analyzer
+from fairwords_analyzer import NO_FINDINGS_SUMMARY, BiasAnalyzer
+
+
+PHRASES = [
+    "We want a Rockstar ninja", "recent graduate", "class of 2023", "Digital Native",
+    "aggressive and competitive", "driven", "Ivy League", "top 10 university",
+    "Russell Group", "culture fit", "fits in", "we're a family", "native English speaker",
+    "Native-level English", "no gaps in employment", "24/7", "always available",
+    "on-call 24 hours", "Internship role", "entry level", "entry-level",
+    "3+ years of experience", "2 years exp", "not overqualified", "don't be overqualified",
+    "rock star", "superheroes", "guru's", "TOP-TIER SCHOOL", "fresh perspective",
+    "data-driven", "fight club", "hello world", "\n",
+    # Non-ASCII text: Unicode spaces and digits, letters touching matches
+    "intern 5\xa0years experience", "Entry level role, 5+\u2009years experience",
+    "éninja", "ninjaé", "ninja é", "café", "naïve",
+    "İstanbul", "\u3000guru\u3000", "x\ud800",
+]
+
+
+def reference_findings(text):
+    """Per-pattern finditer with Python re: {id: (unique matches, positions)}."""
+    findings = {}
+    for pattern_def in BIAS_PATTERNS:
+        # The analyzer only recognises ASCII digits (see bias_patterns)
+        pattern = pattern_def["pattern"].replace(r"\d", "[0-9]")
+        matches = list(re.finditer(pattern, text, re.IGNORECASE))
+        if matches:
+            findings[pattern_def["id"]] = (
+                sorted(set(m.group(0) for m in matches)),
+                [m.start() for m in matches]
+            )
+    return findings
+
+
+def detected_findings(analyzer, text):
+    """Analyzer findings in the same shape as reference_findings."""
+    return {
+        f["id"]: (sorted(f["matches"]), f["positions"])
+        for f in analyzer.analyze(text)["findings"]
+    }
+
+
+def reference_score_and_summary(findings):
+    """Score and summary as the original analyzer computed them from per-pattern findings."""
+    if not findings:
+        return 100, "No bias patterns detected. This job description uses inclusive language."
+    
+    by_id = {p["id"]: p for p in BIAS_PATTERNS}
+    weights = {"high": 15, "medium": 8, "low": 3}
+    severities = [by_id[pattern_id]["severity"] for pattern_id in findings]
+    score = 100 - sum(
+        weights[by_id[pattern_id]["severity"]] * len(positions)
+        for pattern_id, (_, positions) in findings.items()
+    )
+    score = max(0, min(100, score))
+    
+    total = len(findings)
+    categories = len({by_id[pattern_id]["category"] for pattern_id in findings})
+    high_severity = severities.count("high")
+    summary = f"Found {total} bias pattern{'s' if total > 1 else ''} across {categories} categor{'ies' if categories > 1 else 'y'}."
+    if high_severity > 0:
+        summary += f" {high_severity} high-severity issue{'s' if high_severity > 1 else ''} detected."
+    if score < 50:
+        summary += " This job description needs significant revision to attract diverse candidates."
+    elif score < 80:
+        summary += " Several improvements recommended to increase inclusivity."
+    else:
+        summary += " Minor adjustments would improve fairness."
+    return score, summary
+
+
+@pytest.fixture
+def analyzer():
+    return BiasAnalyzer()
+
+
+def test_scan_matches_per_pattern_finditer(analyzer):
+    rng = random.Random(1)
+    for _ in range(500):
+        text = " ".join(rng.choice(PHRASES) for _ in range(rng.randint(1, 25)))
+        assert detected_findings(analyzer, text) == reference_findings(text), text
+
+
+def test_long_match_does_not_hide_other_patterns(analyzer):
+    text = "Internship: we want a rockstar who is a culture fit, with 3 years experience."
+    found = detected_findings(analyzer, text)
+    assert set(found) == {"intern_experience_paradox", "masculine_coded", "culture_fit"}
+    assert found == reference_findings(text)
+
+
+def test_no_two_patterns_match_at_same_offset():
+    # The combined scan reports only the earliest-listed pattern at any
+    # start offset, so no phrase may be matched by two patterns from there
+    text = " ".join(PHRASES)
+    starts = {}
+    for pattern_def in BIAS_PATTERNS:
+        for m in re.finditer(pattern_def["pattern"], text, re.IGNORECASE):
+            assert m.start() not in starts, (pattern_def["id"], starts.get(m.start()))
+            starts[m.start()] = pattern_def["id"]
+
+
+@pytest.mark.parametrize("text, pattern_id", [
+    ("intern 5\xa0years experience", "intern_experience_paradox"),
+    ("Entry level role, 5+\u2009years experience", "intern_experience_paradox"),
+])
+def test_unicode_whitespace_matches(analyzer, text, pattern_id):
+    assert pattern_id in detected_findings(analyzer, text)
+
+
+@pytest.mark.parametrize("text", ["éninja", "ninjaé", "Ärockstar", "guru\u0663", "class of 20\u0662\u0663"])
+def test_unicode_word_characters_block_boundaries(analyzer, text):
+    assert detected_findings(analyzer, text) == {}
+
+
+def test_unicode_non_word_characters_allow_boundaries(analyzer):
+    found = detected_findings(analyzer, "é ninja—rockstar\u3000guru")
+    assert found == reference_findings("é ninja—rockstar\u3000guru")
+    assert found["masculine_coded"][1] == [2, 8, 17]
+
+
+def test_shorter_match_found_when_longest_touches_word_character(analyzer):
+    # RE2 prefers the span ending in "expérience"; Python re falls back to
+    # the one ending at the first "experience"
+    text = "Entry-level role requiring 2 years experience (FR: 2 years expérience)"
+    found = detected_findings(analyzer, text)
+    assert found == reference_findings(text)
+    assert found["intern_experience_paradox"][1] == [0]
+
+
+def test_results_are_cached(analyzer):
+    first = analyzer.analyze("We want a rockstar ninja")
+    assert analyzer.analyze("We want a rockstar ninja") is first
+
+
+def test_cache_evicts_least_recently_used(analyzer, monkeypatch):
+    monkeypatch.setattr(fairwords_analyzer, "RESULT_CACHE_SIZE", 2)
+    first = analyzer.analyze("rockstar")
+    second = analyzer.analyze("ninja")
+    assert analyzer.analyze("rockstar") is first
+    analyzer.analyze("guru")
+    assert len(analyzer._results) == 2
+    assert analyzer.analyze("rockstar") is first
+    assert analyzer.analyze("ninja") is not second
+
+
+def test_large_results_are_not_cached(analyzer):
+    text = "ninja " * 20000
+    assert analyzer.analyze(text)["findings"][0]["count"] == 20000
+    assert analyzer._results == {}
+    assert analyzer.analyze(text)["score"] == 0
+
+
+def test_score_and_summary_match_per_pattern_reference(analyzer):
+    rng = random.Random(2)
+    for _ in range(300):
+        text = " ".join(rng.choice(PHRASES) for _ in range(rng.randint(1, 25)))
+        results = analyzer.analyze(text)
+        reference = reference_findings(text)
+        assert (results["score"], results["summary"]) == reference_score_and_summary(reference), text
+        assert results["total_issues"] == len(reference)
+        assert sorted(results["categories_affected"]) == sorted(
+            {p["category"] for p in BIAS_PATTERNS if p["id"] in reference}
+        )
+
+
+def test_explanations_are_keyed_by_pattern_id(analyzer):
+    results = analyzer.analyze("We want a rockstar who is a culture fit")
+    ids = [f["id"] for f in results["findings"]]
+    assert ids == ["masculine_coded", "culture_fit"]
+    assert set(results["patterns"]) == set(ids)
+    by_id = {p["id"]: p for p in BIAS_PATTERNS}
+    for pattern_id, explanation in results["patterns"].items():
+        assert explanation == {
+            field: by_id[pattern_id][field]
+            for field in ("why", "excludes", "impact", "research", "alternative")
+        }
+    for finding in results["findings"]:
+        assert set(finding) == {"id", "category", "severity", "matches", "count", "positions"}
+
+
+def test_clean_text_fast_path(analyzer):
+    text = "We are hiring a backend engineer to build APIs."
+    assert analyzer.analyze(text) == {
+        "score": 100,
+        "findings": [],
+        "patterns": {},
+        "total_issues": 0,
+        "categories_affected": [],
+        "summary": NO_FINDINGS_SUMMARY,
+        "text_length": len(text),
+        "word_count": 9,
+    }
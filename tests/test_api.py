@@ -0,0 +1,51 @@
+"""Tests for the FairWords HTTP API."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from fairwords_main import MAX_TEXT_LENGTH, app
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def test_analyze_accepts_unpaired_surrogate_escape(client):
+    response = client.post(
+        "/analyze",
+        content=b'{"text":"we need a rockstar \\ud800 ninja"}',
+        headers={"Content-Type": "application/json"}
+    )
+    assert response.status_code == 200
+    findings = response.json()["data"]["findings"]
+    assert [f["id"] for f in findings] == ["masculine_coded"]
+    assert findings[0]["positions"] == [10, 21]
+
+
+def test_analyze_returns_unpaired_surrogate_in_matched_phrase(client):
+    response = client.post(
+        "/analyze",
+        content=b'{"text":"intern \\ud800 3 years experience"}',
+        headers={"Content-Type": "application/json"}
+    )
+    assert response.status_code == 200
+    findings = response.json()["data"]["findings"]
+    assert [f["id"] for f in findings] == ["intern_experience_paradox"]
+    assert findings[0]["matches"] == ["intern \ud800 3 years experience"]
+
+
+@pytest.mark.parametrize("text, detail", [
+    ("", "Text cannot be empty"),
+    ("   ", "Text cannot be empty"),
+    ("x" * (MAX_TEXT_LENGTH + 1), "Text too long"),
+], ids=["empty", "whitespace", "too_long"])
+def test_analyze_rejects_empty_and_oversized_text(client, text, detail):
+    response = client.post("/analyze", json={"text": text})
+    assert response.status_code == 400
+    assert response.json()["detail"] == detail
+
+
+def test_analyze_accepts_text_at_length_limit(client):
+    response = client.post("/analyze", json={"text": "x" * MAX_TEXT_LENGTH})
+    assert response.status_code == 200
@@ -0,0 +1,81 @@
+"""Tests for the build-time pattern transforms in bias_patterns."""
+
+import re
+import sys
+import unicodedata
+
+import re2
+
+from bias_patterns import (
+    BIAS_PATTERNS, HOT_FIELDS, _LITERAL_ALTERNATION, _lower_literals, _unicode_classes,
+    literal_alts_to_trie_regex
+)
+
+
+def test_lower_literals_keeps_escape_classes():
+    assert _lower_literals(r"\bNative\S\W\D\B") == r"\bnative\S\W\D\B"
+
+
+def test_lower_literals_keeps_property_classes():
+    assert _lower_literals(r"Russell\p{Lu}Group") == r"russell\p{Lu}group"
+
+
+def _code_points():
+    """Assigned code points except surrogates, which can't be UTF-8 encoded."""
+    for code in range(sys.maxunicode + 1):
+        char = chr(code)
+        if unicodedata.category(char) not in ("Cn", "Cs"):
+            yield char
+
+
+def test_unicode_whitespace_matches_python_str_whitespace():
+    python_class = re.compile(r"\s")
+    re2_class = re2.compile(_unicode_classes(r"\s").encode("utf-8"))
+    re2_in_brackets = re2.compile(_unicode_classes(r"[\s]").encode("utf-8"))
+    for char in _code_points():
+        expected = python_class.fullmatch(char) is not None
+        data = char.encode("utf-8")
+        assert (re2_class.fullmatch(data) is not None) == expected, hex(ord(char))
+        assert (re2_in_brackets.fullmatch(data) is not None) == expected, hex(ord(char))
+
+
+def test_unicode_classes_leave_escaped_backslash_alone():
+    assert _unicode_classes(r"a\\s\s") == r"a\\s[\s\x0b\x1c-\x1f\x85\p{Z}]"
+
+
+def test_trie_regex_escapes_literals():
+    regex = re.compile(literal_alts_to_trie_regex(["x.y", "a+b"]))
+    assert regex.fullmatch("x.y") and regex.fullmatch("a+b")
+    assert not regex.fullmatch("xzy") and not regex.fullmatch("aab")
+
+
+def test_trie_regex_has_no_redundant_groups():
+    assert literal_alts_to_trie_regex(["ab", "abc", "abd"]) == "ab(?:c|d)?"
+    assert literal_alts_to_trie_regex(["rock", "rockstar"]) == "rock(?:star)?"
+
+
+def _variants(pattern):
+    """Strings around a pattern's literal alternatives, hit or near miss."""
+    literal = _LITERAL_ALTERNATION.fullmatch(pattern)
+    alternatives = literal.group(1).split("|") if literal else []
+    for alternative in alternatives:
+        yield from (
+            alternative, alternative.upper(), alternative + "s", "x" + alternative,
+            alternative[:-1], alternative[1:], alternative + " " + alternative
+        )
+
+
+def test_factored_patterns_match_like_their_source():
+    text = " | ".join(v for p in BIAS_PATTERNS for v in _variants(p["pattern"]))
+    for pattern_def, factored in zip(BIAS_PATTERNS, HOT_FIELDS["patterns"]):
+        source_matches = [
+            (m.span(), m.group(0))
+            for m in re.finditer(pattern_def["pattern"], text, re.IGNORECASE)
+        ]
+        factored_matches = [
+            (m.span(), m.group(0))
+            for m in re.finditer(factored, text, re.IGNORECASE)
+        ]
+        if factored != pattern_def["pattern"]:
+            assert source_matches, pattern_def["id"]
+        assert factored_matches == source_matches, pattern_def["id"]